@@ -1,22 +1,25 @@
 import streamlit as st
 import zipfile
-import html
+import hashlib
 import io
-import uuid
+import multiprocessing
 import os
-import re
-from pathlib import Path
-from charset_normalizer import from_bytes
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from epub_builder import build_font_assets, build_single_epub, init_worker, prefetch_encoding
 
-# 페이지 설정
-st.set_page_config(
-    page_title="TXT2EPUB 변환기",
-    page_icon="📚",
-    layout="wide"
-)
+# 변환 작업 프로세스가 이 스크립트를 다시 읽을 때(__mp_main__)는 화면을 그리지 않음
+if __name__ == "__main__":
+    # 페이지 설정
+    st.set_page_config(
+        page_title="TXT2EPUB 변환기",
+        page_icon="📚",
+        layout="wide"
+    )
 
-# CSS 스타일링 (이전과 동일)
-st.markdown("""
+    # CSS 스타일링 (이전과 동일)
+    st.markdown("""
 <style>
     .stProgress > div > div > div > div {
         background-color: #4CAF50;
@@ -156,110 +159,10 @@ st.markdown("""
 MAX_FILE_SIZE = 200 * 1024 * 1024  # 200MB
 MAX_TOTAL_SIZE = 1024 * 1024 * 1024  # 1GB
 ALLOWED_IMAGE_TYPES = ["jpg", "jpeg", "png"]
-
-# 폰트 설정 - 리디바탕만 사용
-FONTS = {
-    "리디바탕": {
-        "file": "RIDIBatang.otf",
-        "css_name": "RIDIBatang",
-        "family": "'RIDIBatang', serif"
-    }
-}
-
-# -------------------------
-# 텍스트 처리 함수
-# -------------------------
-
-def detect_encoding(file_content):
-    """파일의 인코딩을 감지하고 UTF-8로 변환"""
-    try:
-        result = from_bytes(file_content).best()
-        if result and result.encoding:
-            detected_encoding = result.encoding
-            text = str(result)
-            return detected_encoding, text
-    except:
-        pass
-    
-    for encoding in ['utf-8', 'cp949', 'euc-kr', 'latin-1', 'cp1252']:
-        try:
-            text = file_content.decode(encoding, errors='replace')
-            return encoding, text
-        except:
-            continue
-    
-    return 'unknown', file_content.decode('utf-8', errors='replace')
-
-def clean_text(text):
-    """텍스트 정리 및 줄바꿈 정규화"""
-    # HTML 엔티티 이스케이프 먼저 처리
-    text = html.unescape(text)
-    
-    # 다양한 줄바꿈 문자를 \n으로 통일
-    text = text.replace('\r\n', '\n').replace('\r', '\n')
-    
-    # 연속된 줄바꿈을 2개로 제한 (문단 구분)
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    
-    # 줄 시작과 끝의 공백 제거
-    lines = []
-    for line in text.split('\n'):
-        line = line.strip()
-        if line:  # 내용이 있는 줄만 추가
-            lines.append(line)
-        else:
-            lines.append('')  # 빈 줄은 문단 구분자로 유지
-    
-    # 연속된 빈 줄 제거
-    cleaned_lines = []
-    prev_empty = False
-    for line in lines:
-        if line == '':
-            if not prev_empty:
-                cleaned_lines.append('')
-                prev_empty = True
-        else:
-            cleaned_lines.append(line)
-            prev_empty = False
-    
-    return '\n'.join(cleaned_lines)
-
-def process_paragraphs(text, min_chars_per_line=30):
-    """문단 처리 및 자연스러운 줄바꿈 적용"""
-    paragraphs = text.split('\n\n')
-    processed_paragraphs = []
-    
-    for para in paragraphs:
-        if not para.strip():
-            continue
-            
-        lines = para.split('\n')
-        if len(lines) == 1 and len(lines[0]) > min_chars_per_line * 2:
-            # 긴 단일 줄을 문단으로 처리
-            words = lines[0].split()
-            new_lines = []
-            current_line = []
-            current_length = 0
-            
-            for word in words:
-                if current_length + len(word) + 1 <= min_chars_per_line * 2:
-                    current_line.append(word)
-                    current_length += len(word) + 1
-                else:
-                    if current_line:
-                        new_lines.append(' '.join(current_line))
-                    current_line = [word]
-                    current_length = len(word)
-            
-            if current_line:
-                new_lines.append(' '.join(current_line))
-            
-            processed_paragraphs.append('\n'.join(new_lines))
-        else:
-            # 기존 줄바꿈 유지
-            processed_paragraphs.append('\n'.join(lines))
-    
-    return '\n\n'.join(processed_paragraphs)
+COPY_CHUNK_SIZE = 1024 * 1024  # 스트림 복사 단위 (1MB)
+MAX_WORKERS = 8  # 동시에 변환할 최대 파일 수 (작업마다 원문과 결과를 메모리에 들고 있음)
+SPOOL_MAX_SIZE = 32 * 1024 * 1024  # 이보다 큰 결과물은 메모리 대신 디스크 임시 파일에 보관 (32MB)
+POOL_MIN_SIZE = 8 * 1024 * 1024  # 변환할 원문 합계가 이보다 작으면 작업 프로세스 없이 바로 변환 (8MB)
 
 # -------------------------
 # 유틸리티 함수
@@ -274,285 +177,171 @@ def format_size(size_bytes):
     else:
         return f"{size_bytes/(1024*1024):.1f} MB"
 
-def extract_metadata(filename):
-    """파일명에서 제목과 저자 추출"""
-    name = Path(filename).stem
-    author = "미상"
-    title = name
-    
-    if " - " in name:
-        parts = name.split(" - ", 1)
-        title, author = parts[0].strip(), parts[1].strip()
-    elif "_" in name:
-        parts = name.split("_", 1)
-        title, author = parts[0].strip(), parts[1].strip()
-    elif "(" in name and name.endswith(")"):
-        match = re.search(r"(.+)\((.+)\)", name)
-        if match:
-            title, author = match.group(1).strip(), match.group(2).strip()
-    
-    safe_title = re.sub(r'[\\/*?:"<>|]', "", title)
-    return title, author, safe_title
+def spool_stream(stream, suffix=""):
+    """스트림을 크기가 크면 디스크로 넘어가는 임시 파일에 옮겨 담음"""
+    spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, suffix=suffix)
+    stream.seek(0)
+    shutil.copyfileobj(stream, spooled, COPY_CHUNK_SIZE)
+    spooled.seek(0)
+    return spooled
 
-def detect_chapters(lines):
-    """텍스트에서 챕터 자동 감지"""
-    chapters = []
-    current_chapter = "시작"
-    current_lines = []
-    chapter_pattern = re.compile(r'^(제\s?\d+\s?[화장편]|Chapter\s+\d+|\d+\.|제\s*\d+\s*장)')
-    
-    for line in lines:
-        line_stripped = line.strip()
-        if not line_stripped:
-            continue
-        
-        if chapter_pattern.match(line_stripped):
-            if current_lines:
-                chapters.append((current_chapter, current_lines))
-            current_chapter = line_stripped
-            current_lines = []
-        else:
-            current_lines.append(html.escape(line_stripped))
-    
-    if current_lines:
-        chapters.append((current_chapter, current_lines))
-    
-    return chapters if chapters else [("본문", [html.escape(l.strip()) for l in lines if l.strip()])]
+def get_stream_size(stream):
+    """스트림 전체 크기 (읽기 위치는 처음으로 되돌림)"""
+    stream.seek(0, io.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+    return size
 
-def build_single_epub(file_name, file_content, cover_image=None, use_chapter_split=True, selected_font="리디바탕"):
-    """단일 TXT 파일을 EPUB으로 변환"""
-    try:
-        epub_stream = io.BytesIO()
-        book_id = str(uuid.uuid4())
-        
-        # 메타데이터 추출
-        title, author, safe_title = extract_metadata(file_name)
-        
-        # 인코딩 감지 및 UTF-8로 변환
-        detected_encoding, text = detect_encoding(file_content)
-        
-        # 텍스트 정리
-        text = clean_text(text)
-        text = process_paragraphs(text)
-        
-        if detected_encoding.lower() != 'utf-8':
-            st.info(f"📄 '{file_name}' 인코딩: {detected_encoding} → UTF-8 변환됨")
-        
-        lines = text.splitlines()
-        
-        # 폰트 설정
-        font_info = FONTS.get(selected_font, FONTS["리디바탕"])
-        font_file = font_info["file"]
-        font_css_name = font_info["css_name"]
-        font_family = font_info["family"]
-        
-        # 챕터 분할
-        if use_chapter_split:
-            chapters = detect_chapters(lines)
-        else:
-            chapters = [("본문", [html.escape(l.strip()) for l in lines if l.strip()])]
-        
-        # CSS 내용
-        css_content = f'''
-        @font-face {{
-            font-family: '{font_css_name}';
-            src: url('fonts/{font_file}');
-        }}
-        body {{ 
-            font-family: {font_family};
-            line-height: 1.8;
-            margin: 5% 8%;
-            text-align: justify;
-            word-break: break-all;
-        }}
-        p {{
-            margin-top: 0;
-            margin-bottom: 1.5em;
-            text-indent: 1em;
-        }}
-        h1, h2 {{
-            text-align: center;
-            font-weight: bold;
-        }}
-        h1 {{
-            font-size: 1.8em;
-            margin-bottom: 1em;
-        }}
-        h2 {{
-            font-size: 1.4em;
-            margin: 1.5em 0 1em 0;
-        }}
-        .author {{
-            text-align: center;
-            font-size: 1.2em;
-            margin-bottom: 2em;
-            color: #666;
-        }}
-        '''
-        
-        with zipfile.ZipFile(epub_stream, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-            # mimetype 파일
-            zf.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
-            
-            # container.xml
-            container_xml = '''<?xml version="1.0" encoding="UTF-8"?>
-<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
-    <rootfiles>
-        <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
-    </rootfiles>
-</container>'''
-            zf.writestr("META-INF/container.xml", container_xml)
-            
-            # 폰트 추가
-            with open(font_file, "rb") as f:
-                zf.writestr(f"OEBPS/fonts/{font_file}", f.read())
-            
-            # CSS 추가
-            zf.writestr("OEBPS/style.css", css_content)
-            
-            # 표지 처리
-            cover_manifest = ""
-            cover_meta = ""
-            cover_spine = ""
-            
-            if cover_image:
-                zf.writestr("OEBPS/cover.jpg", cover_image.getvalue())
-                
-                cover_xhtml = '''<?xml version="1.0" encoding="utf-8"?>
-<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.1//EN" "http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd">
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-    <title>표지</title>
-    <style type="text/css">
-        body { margin:0; padding:0; text-align:center; background:#f5f5f5; }
-        img { max-width:100%; height:auto; box-shadow: 0 4px 8px rgba(0,0,0,0.1); }
-        .cover-container { padding:20px; }
-    </style>
-</head>
-<body>
-    <div class="cover-container">
-        <img src="cover.jpg" alt="Cover" />
-    </div>
-</body>
-</html>'''
-                zf.writestr("OEBPS/cover.xhtml", cover_xhtml)
-                
-                cover_manifest = f'''
-        <item id="cover-img" href="cover.jpg" media-type="image/jpeg"/>
-        <item id="cover-xhtml" href="cover.xhtml" media-type="application/xhtml+xml"/>'''
-                cover_meta = '<meta name="cover" content="cover-img"/>'
-                cover_spine = '<itemref idref="cover-xhtml"/>'
-            
-            # 챕터 처리
-            manifest_items = ""
-            spine_items = cover_spine
-            ncx_navpoints = ""
-            
-            for i, (ch_title, ch_lines) in enumerate(chapters):
-                fname = f"chapter_{i:04d}.xhtml"
-                
-                header = ""
-                if i == 0:
-                    header = f"<h1>{html.escape(title)}</h1>"
-                    if author != "미상":
-                        header += f'<p class="author">{html.escape(author)}</p>'
-                
-                chapter_header = f"<h2>{html.escape(ch_title)}</h2>"
-                chapter_content = "".join(f"<p>{line}</p>" for line in ch_lines)
-                
-                xhtml = f'''<?xml version="1.0" encoding="utf-8"?>
-<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.1//EN" "http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd">
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-    <link rel="stylesheet" type="text/css" href="style.css"/>
-    <title>{html.escape(ch_title)}</title>
-</head>
-<body>
-    {header}
-    {chapter_header}
-    {chapter_content}
-</body>
-</html>'''
-                
-                zf.writestr(f"OEBPS/{fname}", xhtml)
-                
-                manifest_items += f'\n        <item id="chap{i}" href="{fname}" media-type="application/xhtml+xml"/>'
-                spine_items += f'\n        <itemref idref="chap{i}"/>'
-                
-                ncx_navpoints += f'''
-        <navPoint id="nav{i}" playOrder="{i+1}">
-            <navLabel>
-                <text>{html.escape(ch_title)}</text>
-            </navLabel>
-            <content src="{fname}"/>
-        </navPoint>'''
-            
-            # ncx 파일
-            ncx = f'''<?xml version="1.0" encoding="UTF-8"?>
-<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
-    <head>
-        <meta name="dtb:uid" content="{book_id}"/>
-    </head>
-    <docTitle>
-        <text>{html.escape(title)}</text>
-    </docTitle>
-    <navMap>
-        {ncx_navpoints}
-    </navMap>
-</ncx>'''
-            zf.writestr("OEBPS/toc.ncx", ncx)
-            
-            font_item = f'\n        <item id="font" href="fonts/{font_file}" media-type="application/vnd.ms-opentype"/>'
-            
-            # content.opf
-            opf = f'''<?xml version="1.0" encoding="utf-8"?>
-<package version="2.0" xmlns="http://www.idpf.org/2007/opf" unique-identifier="uid">
-    <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-        <dc:title>{html.escape(title)}</dc:title>
-        <dc:creator>{html.escape(author)}</dc:creator>
-        <dc:language>ko</dc:language>
-        <dc:identifier id="uid">{book_id}</dc:identifier>
-        {cover_meta}
-    </metadata>
-    <manifest>
-        <item id="ncx" href="toc.ncx" media-type="application/x-dtbncx+xml"/>
-        <item id="css" href="style.css" media-type="text/css"/>{cover_manifest}{manifest_items}{font_item}
-    </manifest>
-    <spine toc="ncx">
-        {spine_items}
-    </spine>
-</package>'''
-            zf.writestr("OEBPS/content.opf", opf)
-        
-        epub_stream.seek(0)
-        return (safe_title, epub_stream)
-        
-    except Exception as e:
-        st.error(f"'{file_name}' 변환 중 오류 발생: {str(e)}")
+@st.cache_resource(show_spinner=False)
+def load_font_assets(selected_font):
+    """폰트 파일, CSS, manifest 항목을 한 번만 만들어 캐시"""
+    return build_font_assets(selected_font)
+
+def make_cache_key(file_name, file_content, cover_image, use_chapter_split, selected_font):
+    """변환 결과 캐시 키 (내용은 blake2b 해시로 비교)"""
+    content_hash = hashlib.blake2b(file_content, digest_size=16).digest()
+    cover_hash = hashlib.blake2b(cover_image, digest_size=16).digest() if cover_image else None
+    return (file_name, content_hash, cover_hash, use_chapter_split, selected_font)
+
+@st.cache_resource(show_spinner=False)
+def get_detect_executor():
+    """업로드 직후 인코딩 감지를 미리 돌릴 스레드 풀 (모든 세션이 함께 사용, 작업은 앞부분 표본만 다룸)"""
+    return ThreadPoolExecutor(max_workers=2)
+
+def start_encoding_detection(uploaded_files):
+    """업로드된 파일의 느린 인코딩 감지(charset-normalizer)를 백그라운드에서 미리 시작
+
+    UTF-8/CP949처럼 빠른 경로로 끝나는 파일은 표본만 확인하고 바로 끝난다.
+    사용자가 표지를 고르는 동안 감지를 끝내 두고, 변환할 때 결과를 넘겨준다.
+    지금 목록에 없는 파일의 작업은 버린다.
+    """
+    executor = get_detect_executor()
+    previous_futures = st.session_state.get('encoding_futures', {})
+    encoding_futures = {}
+    for uploaded_file in uploaded_files:
+        future = previous_futures.get(uploaded_file.file_id)
+        if future is None:
+            future = executor.submit(prefetch_encoding, uploaded_file.getvalue())
+        encoding_futures[uploaded_file.file_id] = future
+    st.session_state.encoding_futures = encoding_futures
+
+def get_detected_encoding(uploaded_file):
+    """미리 감지해 둔 인코딩 (빠른 경로 대상이거나, 아직 끝나지 않았거나, 실패했으면 None)"""
+    future = st.session_state.get('encoding_futures', {}).get(uploaded_file.file_id)
+    if future is None or not future.done() or future.exception() is not None:
         return None
+    return future.result()
 
-def convert_all_files(files_data, cover_images=None, use_chapter_split=True, selected_font="리디바탕"):
-    """여러 파일을 각각 EPUB으로 변환 (각 파일에 개별 표지 적용)"""
-    converted_files = []
-    total_files = len(files_data)
+def convert_in_process(pending, use_chapter_split, font_assets):
+    """메인 프로세스에서 하나씩 변환하며 (순번, 파일명, 캐시 키, 결과, 오류)를 반환"""
+    for idx, file_name, file_content, current_cover, encoding, cache_key in pending:
+        try:
+            result = build_single_epub(file_name, file_content, current_cover,
+                                       use_chapter_split, font_assets, encoding)
+        except Exception as e:
+            yield idx, file_name, cache_key, None, e
+        else:
+            yield idx, file_name, cache_key, result, None
+
+def convert_in_pool(pending, use_chapter_split, font_assets, max_workers):
+    """작업 프로세스에서 병렬로 변환하며 끝나는 순서대로 (순번, 파일명, 캐시 키, 결과, 오류)를 반환"""
+    # 서버 프로세스(스레드가 여럿 돌고 있음)를 fork하지 않고 새 인터프리터로 작업 프로세스를 띄움
+    # 작업 프로세스는 epub_builder만 쓰고, 이 스크립트를 다시 읽더라도 화면은 그리지 않음
+    # 폰트 자료는 작업마다 넘기지 않고 프로세스가 시작할 때 한 번만 넘김
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=init_worker, initargs=(font_assets,)) as executor:
+        futures = {}
+        for idx, file_name, file_content, current_cover, encoding, cache_key in pending:
+            future = executor.submit(build_single_epub, file_name, file_content, current_cover,
+                                     use_chapter_split, None, encoding)
+            futures[future] = (idx, file_name, cache_key)
+        # 작업에 넘긴 원문은 더 붙잡고 있지 않음
+        pending.clear()
+        
+        for future in as_completed(futures):
+            idx, file_name, cache_key = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                yield idx, file_name, cache_key, None, e
+            else:
+                yield idx, file_name, cache_key, result, None
+
+def convert_all_files(uploaded_files, cover_images=None, use_chapter_split=True, selected_font="리디바탕"):
+    """여러 파일을 각각 EPUB으로 변환 (각 파일에 개별 표지 적용, 여러 프로세스에서 병렬 처리)
+
+    같은 입력으로 다시 변환하면 이전 결과(st.session_state.epub_cache)를 그대로 사용한다.
+    """
+    total_files = len(uploaded_files)
+    results = [None] * total_files
     
     progress_bar = st.progress(0)
     status_text = st.empty()
+    status_text.text(f"📖 변환 중... (0/{total_files})")
+    
+    # 이전 변환 결과 중 이번에도 쓰이는 것만 남김
+    previous_cache = st.session_state.get('epub_cache', {})
+    epub_cache = {}
+    pending = []
     
-    for idx, (file_name, file_content) in enumerate(files_data):
-        status_text.text(f"📖 변환 중: {file_name} ({idx + 1}/{total_files})")
+    for idx, uploaded_file in enumerate(uploaded_files):
+        # 파일 내용은 작업을 넘길 때 한 번만 꺼냄
+        file_name = uploaded_file.name
+        file_content = uploaded_file.getvalue()
         
-        # 각 파일에 해당하는 표지 이미지 사용
+        # 각 파일에 해당하는 표지 이미지 사용 (프로세스로 넘길 수 있도록 bytes로 전달)
         current_cover = None
-        if cover_images and idx < len(cover_images):
-            current_cover = cover_images[idx]
+        if cover_images and idx < len(cover_images) and cover_images[idx]:
+            current_cover = cover_images[idx].getvalue()
         
-        result = build_single_epub(file_name, file_content, current_cover, use_chapter_split, selected_font)
+        cache_key = make_cache_key(file_name, file_content, current_cover, use_chapter_split, selected_font)
+        if cache_key in previous_cache:
+            results[idx] = epub_cache[cache_key] = previous_cache[cache_key]
+        else:
+            # 미리 감지가 끝났으면 그 결과를 넘기고, 아니면 작업 프로세스에서 감지
+            encoding = get_detected_encoding(uploaded_file)
+            pending.append((idx, file_name, file_content, current_cover, encoding, cache_key))
+    
+    done = total_files - len(pending)
+    progress_bar.progress(done / total_files)
+    
+    if pending:
+        # 폰트와 CSS는 메인 프로세스에서 한 번만 만들어 각 작업에 전달
+        font_assets = load_font_assets(selected_font)
+        
+        # 작업 프로세스가 하나뿐이면(파일 하나, CPU 하나) 병렬 이득 없이 새 인터프리터와 피클 비용만 들고,
+        # 작은 묶음은 새 인터프리터를 띄우는 시간이 변환보다 오래 걸리므로 바로 변환
+        max_workers = min(MAX_WORKERS, os.cpu_count() or 1, len(pending))
+        if max_workers == 1 or sum(len(item[2]) for item in pending) < POOL_MIN_SIZE:
+            outcomes = convert_in_process(pending, use_chapter_split, font_assets)
+        else:
+            outcomes = convert_in_pool(pending, use_chapter_split, font_assets, max_workers)
         
+        # UI 갱신은 메인 프로세스에서만 처리
+        for idx, file_name, cache_key, result, error in outcomes:
+            if error is not None:
+                st.error(f"'{file_name}' 변환 중 오류 발생: {str(error)}")
+            else:
+                safe_title, epub_stream, detected_encoding = result
+                # 세션에 오래 남는 결과물은 큰 것부터 디스크로 내려보냄
+                results[idx] = epub_cache[cache_key] = (
+                    safe_title, spool_stream(epub_stream, suffix=".epub"), detected_encoding)
+                del result, epub_stream
+            
+            done += 1
+            status_text.text(f"📖 변환 중... ({done}/{total_files})")
+            progress_bar.progress(done / total_files)
+    
+    st.session_state.epub_cache = epub_cache
+    
+    converted_files = []
+    for uploaded_file, result in zip(uploaded_files, results):
         if result:
-            converted_files.append(result)
-        
-        progress_bar.progress((idx + 1) / total_files)
+            safe_title, epub_stream, detected_encoding = result
+            if detected_encoding.lower() != 'utf-8':
+                st.info(f"📄 '{uploaded_file.name}' 인코딩: {detected_encoding} → UTF-8 변환됨")
+            converted_files.append((safe_title, epub_stream))
     
     status_text.text("✅ 모든 파일 변환 완료!")
     return converted_files
@@ -583,39 +372,41 @@ def convert_all_files(files_data, cover_images=None, use_chapter_split=True, sel
 # 메인 UI
 # -------------------------
 
-if 'initialized' not in st.session_state:
-    st.session_state.initialized = True
-    st.session_state.converted_files = []
-    st.session_state.uploaded_files = []
-    st.session_state.cover_images = []
-    st.session_state.conversion_complete = False
+# 변환 작업 프로세스가 이 스크립트를 다시 읽을 때(__mp_main__)는 화면을 그리지 않음
+if __name__ == "__main__":
+    if 'initialized' not in st.session_state:
+        st.session_state.initialized = True
+        st.session_state.converted_files = []
+        st.session_state.uploaded_files = []
+        st.session_state.cover_images = []
+        st.session_state.conversion_complete = False
 
-st.title("📚 TXT2EPUB 변환기")
-st.markdown('<p class="upload-text">여러 TXT 파일을 각각 EPUB 전자책으로 변환합니다.</p>', unsafe_allow_html=True)
+    st.title("📚 TXT2EPUB 변환기")
+    st.markdown('<p class="upload-text">여러 TXT 파일을 각각 EPUB 전자책으로 변환합니다.</p>', unsafe_allow_html=True)
 
-# 사이드바
-with st.sidebar:
-    st.header("⚙️ 변환 설정")
-    
-    st.success("✅ 리디바탕 폰트 사용")
-    selected_font = "리디바탕"
-    
-    st.divider()
-    
-    use_chapter_split = st.checkbox("자동 챕터 분할 사용", value=True, 
-                                    help="텍스트에서 챕터를 자동으로 감지하여 분할합니다.")
-    
-    st.divider()
-    
-    # 파일 정보 섹션
-    st.header("📊 파일 정보")
-    
-    if st.session_state.uploaded_files and len(st.session_state.uploaded_files) > 0:
-        total_files = len(st.session_state.uploaded_files)
-        total_size = sum(len(f.getvalue()) for f in st.session_state.uploaded_files)
+    # 사이드바
+    with st.sidebar:
+        st.header("⚙️ 변환 설정")
+        
+        st.success("✅ 리디바탕 폰트 사용")
+        selected_font = "리디바탕"
+        
+        st.divider()
+        
+        use_chapter_split = st.checkbox("자동 챕터 분할 사용", value=True, 
+                                        help="텍스트에서 챕터를 자동으로 감지하여 분할합니다.")
+        
+        st.divider()
+        
+        # 파일 정보 섹션
+        st.header("📊 파일 정보")
         
-        # 통계 카드
-        st.markdown(f"""
+        if st.session_state.uploaded_files and len(st.session_state.uploaded_files) > 0:
+            total_files = len(st.session_state.uploaded_files)
+            total_size = sum(f.size for f in st.session_state.uploaded_files)
+            
+            # 통계 카드
+            st.markdown(f"""
         <div class="stat-card">
             <h3>{total_files}</h3>
             <p>전체 파일 수</p>
@@ -623,260 +414,268 @@ with st.sidebar:
             <p>전체 용량</p>
         </div>
         """, unsafe_allow_html=True)
+            
+            # 파일 목록 (항상 표시)
+            st.markdown("**📋 파일 목록**")
+            for i, file in enumerate(st.session_state.uploaded_files, 1):
+                st.markdown(f'{i}. {file.name} ({format_size(file.size)})')
+            
+            st.divider()
+            
+            # 사이드바의 초기화 버튼
+            if st.button("🗑️ 모든 파일 지우기", use_container_width=True, type="primary"):
+                st.session_state.upload_counter = st.session_state.get('upload_counter', 0) + 1
+                st.session_state.uploaded_files = []
+                st.session_state.cover_images = []
+                st.session_state.converted_files = []
+                st.session_state.epub_cache = {}
+                st.session_state.encoding_futures = {}
+                st.session_state.conversion_complete = False
+                st.session_state.size_error = False
+                st.rerun()
+        else:
+            st.info("업로드된 파일이 없습니다.")
+
+    # 메인 영역
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.subheader("📂 TXT 파일 업로드")
+        
+        # 파일 업로더 (매번 새로운 키 사용)
+        upload_key = f"file_uploader_{st.session_state.get('upload_counter', 0)}"
+        new_files = st.file_uploader(
+            "TXT 파일을 드래그하거나 클릭하여 업로드하세요 (여러 파일 선택 가능)",
+            type=["txt"],
+            accept_multiple_files=True,
+            key=upload_key,
+            help=f"파일당 최대 {format_size(MAX_FILE_SIZE)}까지 업로드 가능합니다."
+        )
         
-        # 파일 목록 (항상 표시)
-        st.markdown("**📋 파일 목록**")
-        for i, file in enumerate(st.session_state.uploaded_files, 1):
-            file_size = len(file.getvalue())
-            st.markdown(f'{i}. {file.name} ({format_size(file_size)})')
-        
-        st.divider()
+        # 업로드 카운터 초기화
+        if 'upload_counter' not in st.session_state:
+            st.session_state.upload_counter = 0
         
-        # 사이드바의 초기화 버튼
-        if st.button("🗑️ 모든 파일 지우기", use_container_width=True, type="primary"):
-            st.session_state.upload_counter = st.session_state.get('upload_counter', 0) + 1
+        # 현재 파일 목록 초기화
+        if 'uploaded_files' not in st.session_state:
             st.session_state.uploaded_files = []
+        if 'cover_images' not in st.session_state:
             st.session_state.cover_images = []
-            st.session_state.converted_files = []
-            st.session_state.conversion_complete = False
+        if 'size_error' not in st.session_state:
             st.session_state.size_error = False
-            st.rerun()
-    else:
-        st.info("업로드된 파일이 없습니다.")
-
-# 메인 영역
-col1, col2 = st.columns([2, 1])
-
-with col1:
-    st.subheader("📂 TXT 파일 업로드")
-    
-    # 파일 업로더 (매번 새로운 키 사용)
-    upload_key = f"file_uploader_{st.session_state.get('upload_counter', 0)}"
-    new_files = st.file_uploader(
-        "TXT 파일을 드래그하거나 클릭하여 업로드하세요 (여러 파일 선택 가능)",
-        type=["txt"],
-        accept_multiple_files=True,
-        key=upload_key,
-        help=f"파일당 최대 {format_size(MAX_FILE_SIZE)}까지 업로드 가능합니다."
-    )
-    
-    # 업로드 카운터 초기화
-    if 'upload_counter' not in st.session_state:
-        st.session_state.upload_counter = 0
-    
-    # 현재 파일 목록 초기화
-    if 'uploaded_files' not in st.session_state:
-        st.session_state.uploaded_files = []
-    if 'cover_images' not in st.session_state:
-        st.session_state.cover_images = []
-    if 'size_error' not in st.session_state:
-        st.session_state.size_error = False
-    
-    # 새 파일이 업로드되었을 때 처리
-    if new_files and len(new_files) > 0:
-        # 기존 파일 목록
-        current_files = st.session_state.uploaded_files.copy()
-        current_names = {f.name for f in current_files}
         
-        # 새 파일 처리
-        valid_new_files = []
-        for file in new_files:
-            file_size = len(file.getvalue())
+        # 새 파일이 업로드되었을 때 처리
+        if new_files and len(new_files) > 0:
+            # 기존 파일 목록 (파일명 → 파일)
+            files_by_name = {f.name: f for f in st.session_state.uploaded_files}
+            total_size = sum(f.size for f in files_by_name.values())
             
-            # 파일당 용량 체크 (200MB)
-            if file_size > MAX_FILE_SIZE:
-                st.error(f"❌ {file.name}: 파일당 최대 용량 초과 ({format_size(file_size)} / 200MB)")
-            else:
-                # 중복 체크 (같은 이름의 파일이 있으면 교체)
-                if file.name in current_names:
-                    # 기존 파일 제거
-                    current_files = [f for f in current_files if f.name != file.name]
-                valid_new_files.append(file)
-        
-        # 모든 파일 합치기
-        all_files = current_files + valid_new_files
-        
-        # 전체 용량 계산
-        total_size = 0
-        for file in all_files:
-            total_size += len(file.getvalue())
-        
-        # 전체 용량 체크 (1GB)
-        if total_size > MAX_TOTAL_SIZE:
-            st.error(f"❌ 전체 용량이 최대치(1GB)를 초과했습니다. ({format_size(total_size)} / 1GB)")
-            st.warning("1GB를 초과하면 변환할 수 없습니다. 파일을 줄여주세요.")
-            st.session_state.size_error = True
+            # 새 파일 처리 (용량 체크, 중복 교체, 전체 용량 계산을 한 번에)
+            valid_new_count = 0
+            for file in new_files:
+                file_size = file.size
+                
+                # 파일당 용량 체크 (200MB)
+                if file_size > MAX_FILE_SIZE:
+                    st.error(f"❌ {file.name}: 파일당 최대 용량 초과 ({format_size(file_size)} / 200MB)")
+                    continue
+                
+                # 중복 체크 (같은 이름의 파일이 있으면 빼고 새 파일을 맨 뒤에 추가)
+                replaced = files_by_name.pop(file.name, None)
+                if replaced is not None:
+                    total_size -= replaced.size
+                files_by_name[file.name] = file
+                total_size += file_size
+                valid_new_count += 1
+            
+            # 모든 파일 합치기
+            all_files = list(files_by_name.values())
+            
+            # 전체 용량 체크 (1GB)
+            if total_size > MAX_TOTAL_SIZE:
+                st.error(f"❌ 전체 용량이 최대치(1GB)를 초과했습니다. ({format_size(total_size)} / 1GB)")
+                st.warning("1GB를 초과하면 변환할 수 없습니다. 파일을 줄여주세요.")
+                st.session_state.size_error = True
+                
+                if st.button("🗑️ 초기화", key=f"reset_{st.session_state.upload_counter}"):
+                    st.session_state.upload_counter += 1
+                    st.session_state.uploaded_files = []
+                    st.session_state.cover_images = []
+                    st.session_state.size_error = False
+                    st.rerun()
             
-            if st.button("🗑️ 초기화", key=f"reset_{st.session_state.upload_counter}"):
+            elif total_size <= MAX_TOTAL_SIZE and valid_new_count:
+                # 용량이 정상일 때 저장
+                st.session_state.uploaded_files = all_files
+                # 표지 배열 크기 조정
+                st.session_state.cover_images = [None] * len(all_files)
                 st.session_state.upload_counter += 1
-                st.session_state.uploaded_files = []
-                st.session_state.cover_images = []
                 st.session_state.size_error = False
+                # 표지를 고르는 동안 인코딩 감지를 미리 해 둠
+                start_encoding_detection(all_files)
+                st.success(f"✅ {valid_new_count}개 파일 추가됨 (총 {len(all_files)}개)")
                 st.rerun()
-        
-        elif total_size <= MAX_TOTAL_SIZE and valid_new_files:
-            # 용량이 정상일 때 저장
-            st.session_state.uploaded_files = all_files
-            # 표지 배열 크기 조정
-            st.session_state.cover_images = [None] * len(all_files)
-            st.session_state.upload_counter += 1
-            st.session_state.size_error = False
-            st.success(f"✅ {len(valid_new_files)}개 파일 추가됨 (총 {len(all_files)}개)")
-            st.rerun()
 
-with col2:
-    st.subheader("🖼️ 표지 설정")
-    st.markdown("각 파일마다 다른 표지를 지정할 수 있습니다.")
-    
-    # cover_images가 없으면 초기화
-    if 'cover_images' not in st.session_state:
-        st.session_state.cover_images = []
-    
-    if st.session_state.uploaded_files:
-        # 첫 번째 표지 일괄 적용 체크박스
-        apply_first_cover_all = st.checkbox(
-            "📌 첫 번째 표지를 모든 파일에 적용",
-            value=False,
-            key="apply_first_cover",
-            help="체크하면 첫 번째 파일에 업로드한 표지 이미지가 모든 TXT 파일의 표지로 사용됩니다."
-        )
-        
-        st.divider()
+    with col2:
+        st.subheader("🖼️ 표지 설정")
+        st.markdown("각 파일마다 다른 표지를 지정할 수 있습니다.")
         
-        # 각 파일별 표지 업로드 UI
-        cover_images = []
+        # cover_images가 없으면 초기화
+        if 'cover_images' not in st.session_state:
+            st.session_state.cover_images = []
         
-        with st.expander("📸 파일별 표지 업로드", expanded=True):
-            for idx, file in enumerate(st.session_state.uploaded_files):
-                st.markdown(f"**{idx + 1}. {file.name[:30]}**")
-                
-                # 표지 업로드 UI (첫 번째 파일만 표시하거나, 체크박스 해제 시 모두 표시)
-                show_uploader = not apply_first_cover_all or idx == 0
-                
-                if show_uploader:
-                    cover_key = f"cover_{idx}_{file.name}"
-                    cover_file = st.file_uploader(
-                        f"표지 이미지",
-                        type=ALLOWED_IMAGE_TYPES,
-                        key=cover_key,
-                        label_visibility="collapsed"
-                    )
+        if st.session_state.uploaded_files:
+            # 첫 번째 표지 일괄 적용 체크박스
+            apply_first_cover_all = st.checkbox(
+                "📌 첫 번째 표지를 모든 파일에 적용",
+                value=False,
+                key="apply_first_cover",
+                help="체크하면 첫 번째 파일에 업로드한 표지 이미지가 모든 TXT 파일의 표지로 사용됩니다."
+            )
+            
+            st.divider()
+            
+            # 각 파일별 표지 업로드 UI
+            cover_images = []
+            
+            with st.expander("📸 파일별 표지 업로드", expanded=True):
+                for idx, file in enumerate(st.session_state.uploaded_files):
+                    st.markdown(f"**{idx + 1}. {file.name[:30]}**")
+                    
+                    # 표지 업로드 UI (첫 번째 파일만 표시하거나, 체크박스 해제 시 모두 표시)
+                    show_uploader = not apply_first_cover_all or idx == 0
                     
-                    if cover_file:
-                        cover_images.append(cover_file)
-                        # 미리보기
-                        st.image(cover_file, width=100, caption=f"표지 {idx + 1}")
+                    if show_uploader:
+                        cover_key = f"cover_{idx}_{file.name}"
+                        cover_file = st.file_uploader(
+                            f"표지 이미지",
+                            type=ALLOWED_IMAGE_TYPES,
+                            key=cover_key,
+                            label_visibility="collapsed"
+                        )
+                        
+                        if cover_file:
+                            cover_images.append(cover_file)
+                            # 미리보기
+                            st.image(cover_file, width=100, caption=f"표지 {idx + 1}")
+                        else:
+                            # 기존 표지 유지 또는 None
+                            if idx < len(st.session_state.cover_images):
+                                cover_images.append(st.session_state.cover_images[idx])
+                            else:
+                                cover_images.append(None)
                     else:
-                        # 기존 표지 유지 또는 None
-                        if idx < len(st.session_state.cover_images):
-                            cover_images.append(st.session_state.cover_images[idx])
+                        # 첫 번째 표지가 있으면 그 표지를 모든 파일에 적용
+                        if st.session_state.cover_images and st.session_state.cover_images[0]:
+                            cover_images.append(st.session_state.cover_images[0])
+                            if idx == 1:  # 첫 번째 이후 파일에만 안내 메시지 표시
+                                st.info(f"✅ 첫 번째 표지가 모든 파일에 적용됩니다")
                         else:
                             cover_images.append(None)
+                            if idx == 1:
+                                st.info("첫 번째 파일에 표지를 업로드하면 모든 파일에 적용됩니다")
+            
+            # 표지 배열 업데이트
+            if cover_images and len(cover_images) == len(st.session_state.uploaded_files):
+                st.session_state.cover_images = cover_images
+            
+            # 표지 적용 안내
+            if st.session_state.cover_images and any(st.session_state.cover_images):
+                cover_count = sum(1 for c in st.session_state.cover_images if c)
+                if apply_first_cover_all and cover_count > 0:
+                    st.success(f"✅ 모든 파일에 첫 번째 표지가 적용됩니다.")
                 else:
-                    # 첫 번째 표지가 있으면 그 표지를 모든 파일에 적용
-                    if st.session_state.cover_images and st.session_state.cover_images[0]:
-                        cover_images.append(st.session_state.cover_images[0])
-                        if idx == 1:  # 첫 번째 이후 파일에만 안내 메시지 표시
-                            st.info(f"✅ 첫 번째 표지가 모든 파일에 적용됩니다")
-                    else:
-                        cover_images.append(None)
-                        if idx == 1:
-                            st.info("첫 번째 파일에 표지를 업로드하면 모든 파일에 적용됩니다")
-        
-        # 표지 배열 업데이트
-        if cover_images and len(cover_images) == len(st.session_state.uploaded_files):
-            st.session_state.cover_images = cover_images
-        
-        # 표지 적용 안내
-        if st.session_state.cover_images and any(st.session_state.cover_images):
-            cover_count = sum(1 for c in st.session_state.cover_images if c)
-            if apply_first_cover_all and cover_count > 0:
-                st.success(f"✅ 모든 파일에 첫 번째 표지가 적용됩니다.")
+                    st.success(f"✅ {cover_count}개 파일에 표지가 지정되었습니다.")
             else:
-                st.success(f"✅ {cover_count}개 파일에 표지가 지정되었습니다.")
+                st.info("표지 없이 변환합니다.")
         else:
-            st.info("표지 없이 변환합니다.")
-    else:
-        st.info("먼저 TXT 파일을 업로드해주세요.")
+            st.info("먼저 TXT 파일을 업로드해주세요.")
 
-# 변환 버튼 및 실행
-if st.session_state.uploaded_files and len(st.session_state.uploaded_files) > 0:
-    if st.session_state.get('size_error', False):
-        st.divider()
-        st.warning("⚠️ 전체 용량이 1GB를 초과하여 변환할 수 없습니다.")
-    else:
-        st.divider()
-        col_btn1, col_btn2, col_btn3 = st.columns([1, 2, 1])
-        with col_btn2:
-            convert_button = st.button("🔮 EPUB 변환 시작", type="primary", use_container_width=True)
-        
-        if convert_button:
-            with st.spinner("📚 EPUB 변환 중..."):
-                files_data = [(f.name, f.getvalue()) for f in st.session_state.uploaded_files]
-                converted = convert_all_files(files_data, st.session_state.cover_images, use_chapter_split, selected_font)
-                
-                if converted:
-                    st.session_state.converted_files = converted
-                    st.session_state.conversion_complete = True
-                    st.rerun()
+    # 변환 버튼 및 실행
+    if st.session_state.uploaded_files and len(st.session_state.uploaded_files) > 0:
+        if st.session_state.get('size_error', False):
+            st.divider()
+            st.warning("⚠️ 전체 용량이 1GB를 초과하여 변환할 수 없습니다.")
+        else:
+            st.divider()
+            col_btn1, col_btn2, col_btn3 = st.columns([1, 2, 1])
+            with col_btn2:
+                convert_button = st.button("🔮 EPUB 변환 시작", type="primary", use_container_width=True)
+            
+            if convert_button:
+                with st.spinner("📚 EPUB 변환 중..."):
+                    converted = convert_all_files(st.session_state.uploaded_files, st.session_state.cover_images,
+                                                  use_chapter_split, selected_font)
+                    
+                    if converted:
+                        st.session_state.converted_files = converted
+                        st.session_state.conversion_complete = True
+                        st.rerun()
 
-# 변환 완료 후 다운로드 섹션
-if st.session_state.get('conversion_complete', False) and st.session_state.converted_files:
-    st.divider()
-    
-    st.subheader("📥 다운로드")
-    
-    converted_count = len(st.session_state.converted_files)
-    
-    if converted_count == 1:
-        # 파일이 1개일 때는 개별 다운로드
-        st.info("📕 1개 파일이 변환되었습니다.")
-        
-        safe_title, epub_data = st.session_state.converted_files[0]
-        file_size = len(epub_data.getvalue())
-        
-        st.download_button(
-            label=f"📕 {safe_title}.epub 다운로드 ({format_size(file_size)})",
-            data=epub_data,
-            file_name=f"{safe_title}.epub",
-            mime="application/epub+zip",
-            use_container_width=True,
-            key="download_single"
-        )
-    else:
-        # 파일이 여러 개일 때는 ZIP으로만 다운로드
-        st.info(f"📦 총 {converted_count}개 파일이 변환되었습니다. ZIP 파일로 일괄 다운로드됩니다.")
-        
-        # ZIP 파일 생성
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-            for safe_title, epub_data in st.session_state.converted_files:
-                zf.writestr(f"{safe_title}.epub", epub_data.getvalue())
+    # 변환 완료 후 다운로드 섹션
+    if st.session_state.get('conversion_complete', False) and st.session_state.converted_files:
+        st.divider()
         
-        zip_size = zip_buffer.tell()
+        st.subheader("📥 다운로드")
         
-        # ZIP 파일 다운로드 버튼
-        st.download_button(
-            label=f"📥 모든 파일 ZIP 다운로드 ({format_size(zip_size)})",
-            data=zip_buffer.getvalue(),
-            file_name="converted_epubs.zip",
-            mime="application/zip",
-            use_container_width=True,
-            key="download_zip"
-        )
+        converted_count = len(st.session_state.converted_files)
         
-        # 파일 목록 표시 (참고용)
-        with st.expander("📋 변환된 파일 목록"):
-            for i, (safe_title, epub_data) in enumerate(st.session_state.converted_files, 1):
-                file_size = len(epub_data.getvalue())
-                st.text(f"{i}. {safe_title}.epub ({format_size(file_size)})")
+        if converted_count == 1:
+            # 파일이 1개일 때는 개별 다운로드
+            st.info("📕 1개 파일이 변환되었습니다.")
+            
+            safe_title, epub_data = st.session_state.converted_files[0]
+            file_size = get_stream_size(epub_data)
+            
+            st.download_button(
+                label=f"📕 {safe_title}.epub 다운로드 ({format_size(file_size)})",
+                data=epub_data.read(),
+                file_name=f"{safe_title}.epub",
+                mime="application/epub+zip",
+                use_container_width=True,
+                key="download_single"
+            )
+        else:
+            # 파일이 여러 개일 때는 ZIP으로만 다운로드
+            st.info(f"📦 총 {converted_count}개 파일이 변환되었습니다. ZIP 파일로 일괄 다운로드됩니다.")
+            
+            # ZIP 파일 생성
+            # 묶음 ZIP도 크면 디스크 임시 파일에 만듦 (download_button에는 bytes로 넘김)
+            zip_buffer = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, suffix=".zip")
+            # EPUB은 이미 압축되어 있으므로 다시 압축하지 않고 그대로 담음
+            with zipfile.ZipFile(zip_buffer, "w", compression=zipfile.ZIP_STORED) as zf:
+                for safe_title, epub_data in st.session_state.converted_files:
+                    # EPUB 내용을 통째로 복사하지 않고 조각 단위로 옮겨 씀
+                    # (크기를 미리 알 수 없는 스트림 쓰기라 2GB를 넘는 항목은 ZIP64로 열어야 함)
+                    epub_size = get_stream_size(epub_data)
+                    with zf.open(f"{safe_title}.epub", "w", force_zip64=epub_size > zipfile.ZIP64_LIMIT) as dst:
+                        shutil.copyfileobj(epub_data, dst, COPY_CHUNK_SIZE)
+            
+            zip_size = zip_buffer.tell()
+            zip_buffer.seek(0)
+            
+            # ZIP 파일 다운로드 버튼
+            st.download_button(
+                label=f"📥 모든 파일 ZIP 다운로드 ({format_size(zip_size)})",
+                data=zip_buffer.read(),
+                file_name="converted_epubs.zip",
+                mime="application/zip",
+                use_container_width=True,
+                key="download_zip"
+            )
+            
+            # 파일 목록 표시 (참고용)
+            with st.expander("📋 변환된 파일 목록"):
+                for i, (safe_title, epub_data) in enumerate(st.session_state.converted_files, 1):
+                    file_size = get_stream_size(epub_data)
+                    st.text(f"{i}. {safe_title}.epub ({format_size(file_size)})")
 
-if st.session_state.uploaded_files and not st.session_state.get('conversion_complete', False):
-    st.info("👆 'EPUB 변환 시작' 버튼을 클릭하여 변환을 시작하세요.")
+    if st.session_state.uploaded_files and not st.session_state.get('conversion_complete', False):
+        st.info("👆 'EPUB 변환 시작' 버튼을 클릭하여 변환을 시작하세요.")
 
-# 사용 방법 안내
-with st.expander("📖 사용 방법 안내"):
-    st.markdown("""
+    # 사용 방법 안내
+    with st.expander("📖 사용 방법 안내"):
+        st.markdown("""
     ### 📚 TXT2EPUB 변환기 사용법
     
     1. **TXT 파일 업로드**
@@ -913,9 +712,9 @@ with st.expander("📖 사용 방법 안내"):
     - 모든 텍스트 파일은 UTF-8로 자동 변환되어 처리됨
     """)
 
-# 푸터
-st.divider()
-st.markdown(
-    '<p style="text-align: center; color: #666;">📚 TXT2EPUB 변환기 | 해당 앱은 바이브 코딩으로 생성 되었으며 완전한 Free software 입니다. 자유롭게 수정, 배포하셔도 됩니다</p>',
-    unsafe_allow_html=True
-)
\ No newline at end of file
+    # 푸터
+    st.divider()
+    st.markdown(
+        '<p style="text-align: center; color: #666;">📚 TXT2EPUB 변환기 | 해당 앱은 바이브 코딩으로 생성 되었으며 완전한 Free software 입니다. 자유롭게 수정, 배포하셔도 됩니다</p>',
+        unsafe_allow_html=True
+    )
\ No newline at end of file
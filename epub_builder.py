@@ -0,0 +1,566 @@
+"""TXT 파일을 EPUB으로 변환하는 순수 변환 코드
+
+Streamlit을 쓰지 않으므로 변환 작업 프로세스에서 이 모듈만 불러 실행한다.
+"""
+import codecs
+import html
+import io
+import itertools
+import logging
+import re
+import uuid
+import zipfile
+from pathlib import Path
+from charset_normalizer import from_bytes
+
+logger = logging.getLogger(__name__)
+
+# -------------------------
+# 상수 정의
+# -------------------------
+ENCODING_SAMPLE_SIZE = 256 * 1024  # 인코딩 감지에 사용할 앞부분 크기 (256KB)
+KOREAN_MIN_RATIO = 0.8  # CP949로 읽은 한중일 글자 중 KS X 1001 한글 음절이 이 비율 이상이면 한국어로 봄
+EPUB_COMPRESS_LEVEL = 3  # DEFLATE 압축 수준 (기본값 6보다 빠르고 용량 차이는 작음)
+
+# BOM으로 바로 알 수 있는 인코딩 (UTF-32 LE BOM이 UTF-16 LE BOM으로 시작하므로 UTF-32를 먼저 확인)
+BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# 정규식 (모듈 로드 시 한 번만 컴파일)
+_CRLF_RE = re.compile(r'\r\n?')
+# XML에서 허용되지 않는 제어 문자 (줄바꿈으로 취급되는 \v \f \x1c-\x1e 제외)
+_XML_INVALID_RE = re.compile('[\x00-\x08\x0e-\x1b\x1f\ufffe\uffff]')
+_MULTI_BLANK_RE = re.compile(r'\n{3,}')
+# KS X 1001 한글 음절 2,350자 (EUC-KR B0A1-C8FE, 한국어 문서에 실제로 쓰이는 글자는 거의 여기에 있음)
+_KS_HANGUL_RE = re.compile('[%s]' % bytes(
+    byte for lead in range(0xB0, 0xC9) for trail in range(0xA1, 0xFF) for byte in (lead, trail)
+).decode('euc-kr'))
+# 다른 CJK 인코딩을 CP949로 읽었을 때 섞여 나오는 글자 (한글 음절과 자모, 가나, 한자)
+_CJK_LETTER_RE = re.compile('[\u3040-\u30ff\u3130-\u318f\u4e00-\u9fff\uac00-\ud7a3\uf900-\ufaff]')
+# 줄바꿈으로 취급하는 문자 (str.splitlines 기준)
+_LINE_BREAKS = r'\n\r\v\f\x1c-\x1e\x85\u2028\u2029'
+# 줄바꿈이 아닌 공백
+_INLINE_WS = rf'[^\S{_LINE_BREAKS}]'
+# 빈 줄이 아닌 한 줄
+_LINE_RE = re.compile(rf'[^{_LINE_BREAKS}]+')
+# 챕터 제목으로 시작하는 줄 전체 (앞 공백 허용, 줄바꿈은 넘지 않음)
+_CHAPTER_HEAD = (
+    rf'{_INLINE_WS}*'
+    rf'(?:제(?:{_INLINE_WS}?\d+{_INLINE_WS}?[화장편]|{_INLINE_WS}*\d+{_INLINE_WS}*장)|Chapter{_INLINE_WS}+\d+|\d+\.)'
+    rf'[^{_LINE_BREAKS}]*'
+)
+_CHAPTER_FIRST_LINE_RE = re.compile(_CHAPTER_HEAD)
+# 둘째 줄부터는 앞의 줄바꿈 문자부터 매치 (후방 탐색보다 훨씬 빠르게 훑음)
+_CHAPTER_LINE_RE = re.compile(rf'[{_LINE_BREAKS}]{_CHAPTER_HEAD}')
+_PAREN_RE = re.compile(r'(.+)\((.+)\)')
+_UNSAFE_FN_RE = re.compile(r'[\\/*?:"<>|]')
+
+# 작업 프로세스가 시작할 때 한 번 받아 두는 폰트 자료 (작업마다 폰트 파일을 피클해 넘기지 않도록)
+_worker_font_assets = None
+
+# 폰트 설정 - 리디바탕만 사용
+FONTS = {
+    "리디바탕": {
+        "file": "RIDIBatang.otf",
+        "css_name": "RIDIBatang",
+        "family": "'RIDIBatang', serif"
+    }
+}
+
+# -------------------------
+# EPUB 고정 템플릿 (파일마다 다시 만들지 않도록 미리 준비)
+# -------------------------
+
+CONTAINER_XML_BYTES = b'''<?xml version="1.0" encoding="UTF-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+    <rootfiles>
+        <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+    </rootfiles>
+</container>'''
+
+COVER_XHTML_BYTES = '''<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.1//EN" "http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd">
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head>
+    <title>표지</title>
+    <style type="text/css">
+        body { margin:0; padding:0; text-align:center; background:#f5f5f5; }
+        img { max-width:100%; height:auto; box-shadow: 0 4px 8px rgba(0,0,0,0.1); }
+        .cover-container { padding:20px; }
+    </style>
+</head>
+<body>
+    <div class="cover-container">
+        <img src="cover.jpg" alt="Cover" />
+    </div>
+</body>
+</html>'''.encode("utf-8")
+
+# 폰트 관련 값만 채워 넣는 CSS 템플릿
+CSS_TEMPLATE = '''
+@font-face {{
+    font-family: '{css_name}';
+    src: url('fonts/{file}');
+}}
+body {{ 
+    font-family: {family};
+    line-height: 1.8;
+    margin: 5% 8%;
+    text-align: justify;
+    word-break: break-all;
+}}
+p {{
+    margin-top: 0;
+    margin-bottom: 1.5em;
+    text-indent: 1em;
+}}
+h1, h2 {{
+    text-align: center;
+    font-weight: bold;
+}}
+h1 {{
+    font-size: 1.8em;
+    margin-bottom: 1em;
+}}
+h2 {{
+    font-size: 1.4em;
+    margin: 1.5em 0 1em 0;
+}}
+.author {{
+    text-align: center;
+    font-size: 1.2em;
+    margin-bottom: 2em;
+    color: #666;
+}}
+'''
+
+# 챕터마다 값만 채워 넣는 XHTML 템플릿
+CHAPTER_XHTML_TEMPLATE = '''<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.1//EN" "http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd">
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head>
+    <link rel="stylesheet" type="text/css" href="style.css"/>
+    <title>{title}</title>
+</head>
+<body>
+    {header}
+    {chapter_header}
+    {content}
+</body>
+</html>'''
+
+NAVPOINT_TEMPLATE = '''
+        <navPoint id="nav{index}" playOrder="{order}">
+            <navLabel>
+                <text>{title}</text>
+            </navLabel>
+            <content src="{src}"/>
+        </navPoint>'''
+
+NCX_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
+    <head>
+        <meta name="dtb:uid" content="{book_id}"/>
+    </head>
+    <docTitle>
+        <text>{title}</text>
+    </docTitle>
+    <navMap>
+        {navpoints}
+    </navMap>
+</ncx>'''
+
+OPF_TEMPLATE = '''<?xml version="1.0" encoding="utf-8"?>
+<package version="2.0" xmlns="http://www.idpf.org/2007/opf" unique-identifier="uid">
+    <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+        <dc:title>{title}</dc:title>
+        <dc:creator>{author}</dc:creator>
+        <dc:language>ko</dc:language>
+        <dc:identifier id="uid">{book_id}</dc:identifier>
+        {cover_meta}
+    </metadata>
+    <manifest>
+        <item id="ncx" href="toc.ncx" media-type="application/x-dtbncx+xml"/>
+        <item id="css" href="style.css" media-type="text/css"/>{cover_manifest}{manifest_items}{font_item}
+    </manifest>
+    <spine toc="ncx">
+        {spine_items}
+    </spine>
+</package>'''
+
+COVER_MANIFEST_ITEMS = '''
+        <item id="cover-img" href="cover.jpg" media-type="image/jpeg"/>
+        <item id="cover-xhtml" href="cover.xhtml" media-type="application/xhtml+xml"/>'''
+
+def build_css(font_info):
+    """폰트 정보를 채운 style.css 내용 생성"""
+    return CSS_TEMPLATE.format_map(font_info).encode("utf-8")
+
+# -------------------------
+# 텍스트 처리 함수
+# -------------------------
+
+def detect_encoding(file_content):
+    """파일의 인코딩을 감지하고 UTF-8로 변환"""
+    # BOM이 있으면 감지 과정 생략
+    for bom, encoding in BOM_ENCODINGS:
+        if file_content.startswith(bom):
+            return encoding, file_content.decode(encoding, errors='replace')
+    
+    # UTF-8로 오류 없이 읽히면 그대로 사용
+    try:
+        return 'utf-8', file_content.decode('utf-8')
+    except UnicodeDecodeError:
+        pass
+    
+    # 한국어 TXT에 흔한 CP949(EUC-KR 포함)는 앞부분이 한국어로 보이고 전체가 오류 없이 읽히면 그대로 사용
+    sample = encoding_sample(file_content)
+    if looks_korean_cp949(sample):
+        try:
+            return 'cp949', file_content.decode('cp949')
+        except UnicodeDecodeError:
+            pass
+    
+    # 그 밖의 인코딩은 charset-normalizer로 앞부분만 확인 (디코딩은 직접 한 번만)
+    detected_encoding = detect_sample_encoding(sample)
+    if detected_encoding:
+        return detected_encoding, file_content.decode(detected_encoding, errors='replace')
+    
+    # 감지하지 못하면 모든 바이트를 읽을 수 있는 latin-1로 디코딩
+    return 'latin-1', file_content.decode('latin-1')
+
+def looks_korean_cp949(sample):
+    """표본이 CP949로 오류 없이 읽히고 한국어로 보이는지 확인
+
+    EUC-JP, GBK, Shift_JIS 문서도 CP949로 오류 없이 읽히는 경우가 많으므로,
+    읽어 낸 한중일 글자 대부분이 KS X 1001 한글 음절일 때만 한국어로 본다.
+    """
+    try:
+        # 표본 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음
+        text = codecs.getincrementaldecoder('cp949')().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return False
+    
+    letters = len(_CJK_LETTER_RE.findall(text))
+    return len(_KS_HANGUL_RE.findall(text)) >= letters * KOREAN_MIN_RATIO
+
+def encoding_sample(file_content):
+    """인코딩 감지에 쓸 앞부분 표본 (끝에서 멀티바이트 문자가 잘리지 않게 줄바꿈이나 공백 뒤에서 자름)
+
+    0x0A와 0x20은 Shift_JIS/Big5/GBK/EUC 계열에서 2바이트 문자의 둘째 바이트로 쓰이지 않는다.
+    """
+    if len(file_content) <= ENCODING_SAMPLE_SIZE:
+        return file_content
+    
+    sample = file_content[:ENCODING_SAMPLE_SIZE]
+    cut = sample.rfind(b'\n') + 1 or sample.rfind(b' ') + 1
+    return sample[:cut] if cut else sample
+
+def detect_sample_encoding(sample):
+    """앞부분 표본만으로 charset-normalizer 감지 (실패하면 None)"""
+    try:
+        result = from_bytes(sample, steps=5, chunk_size=512).best()
+        if result and result.encoding:
+            return result.encoding
+    except Exception:
+        logger.warning("charset-normalizer 인코딩 감지 실패", exc_info=True)
+    return None
+
+def prefetch_encoding(file_content):
+    """detect_encoding 중 미리 해 둘 만한 느린 단계(charset-normalizer)만 실행
+
+    BOM이 있거나 앞부분이 UTF-8로 읽히거나 CP949로 읽은 한국어로 보이는 파일은
+    변환할 때 빠른 경로로 끝나므로 None을 반환한다. 그 밖의 파일은 변환할 때도
+    같은 표본으로 charset-normalizer를 돌리므로, 같은 감지 결과를 미리 구할 수 있다.
+    전체 파일을 디코딩하지 않고 앞부분 표본만 다룬다.
+    """
+    if file_content.startswith(tuple(bom for bom, _ in BOM_ENCODINGS)):
+        return None
+    
+    sample = encoding_sample(file_content)
+    try:
+        # 표본 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return None
+    except UnicodeDecodeError:
+        pass
+    
+    if looks_korean_cp949(sample):
+        return None
+    
+    return detect_sample_encoding(sample)
+
+def clean_text(text):
+    """텍스트 정리 및 줄바꿈 정규화"""
+    # HTML 엔티티 이스케이프 먼저 처리
+    text = html.unescape(text)
+    
+    # XHTML을 깨뜨리는 제어 문자 제거
+    text = _XML_INVALID_RE.sub('', text)
+    
+    # 다양한 줄바꿈 문자를 \n으로 통일
+    text = _CRLF_RE.sub('\n', text)
+    
+    # 줄 시작과 끝의 공백 제거 (공백만 있던 줄은 빈 줄이 됨)
+    text = '\n'.join(map(str.strip, text.split('\n')))
+    
+    # 연속된 빈 줄을 하나로 제한 (문단 구분, 앞뒤 끝 포함)
+    text = _MULTI_BLANK_RE.sub('\n\n', text)
+    if text.startswith('\n\n'):
+        text = text[1:]
+    if text.endswith('\n\n'):
+        text = text[:-1]
+    
+    return text
+
+def process_paragraphs(text, min_chars_per_line=30):
+    """문단 처리 및 자연스러운 줄바꿈 적용"""
+    paragraphs = text.split('\n\n')
+    processed_paragraphs = []
+    max_line_length = min_chars_per_line * 2
+    
+    for para in paragraphs:
+        if not para.strip():
+            continue
+            
+        lines = para.split('\n')
+        if len(lines) == 1 and len(lines[0]) > max_line_length:
+            # 긴 단일 줄을 문단으로 처리
+            words = lines[0].split()
+            new_lines = []
+            current_line = []
+            current_length = 0
+            
+            for word in words:
+                if current_length + len(word) + 1 <= max_line_length:
+                    current_line.append(word)
+                    current_length += len(word) + 1
+                else:
+                    if current_line:
+                        new_lines.append(' '.join(current_line))
+                    current_line = [word]
+                    current_length = len(word)
+            
+            if current_line:
+                new_lines.append(' '.join(current_line))
+            
+            processed_paragraphs.append('\n'.join(new_lines))
+        else:
+            # 기존 줄바꿈 유지
+            processed_paragraphs.append('\n'.join(lines))
+    
+    return '\n\n'.join(processed_paragraphs)
+
+# -------------------------
+# EPUB 생성 함수
+# -------------------------
+
+def load_font_bytes(path):
+    """폰트 파일 읽기"""
+    return Path(path).read_bytes()
+
+def build_font_assets(selected_font):
+    """모든 EPUB에 똑같이 들어가는 폰트 파일, CSS, manifest 항목을 한 번에 준비"""
+    font_info = FONTS.get(selected_font, FONTS["리디바탕"])
+    font_file = font_info["file"]
+    return {
+        "path": f"OEBPS/fonts/{font_file}",
+        "bytes": load_font_bytes(font_file),
+        "css": build_css(font_info),
+        "manifest_item": f'\n        <item id="font" href="fonts/{font_file}" media-type="application/vnd.ms-opentype"/>',
+    }
+
+def init_worker(font_assets):
+    """작업 프로세스 초기화: 이 프로세스의 모든 변환에 쓸 폰트 자료를 보관"""
+    global _worker_font_assets
+    _worker_font_assets = font_assets
+
+def extract_metadata(filename):
+    """파일명에서 제목과 저자 추출"""
+    name = Path(filename).stem
+    author = "미상"
+    title = name
+    
+    if " - " in name:
+        parts = name.split(" - ", 1)
+        title, author = parts[0].strip(), parts[1].strip()
+    elif "_" in name:
+        parts = name.split("_", 1)
+        title, author = parts[0].strip(), parts[1].strip()
+    elif "(" in name and name.endswith(")"):
+        match = _PAREN_RE.search(name)
+        if match:
+            title, author = match.group(1).strip(), match.group(2).strip()
+    
+    safe_title = _UNSAFE_FN_RE.sub("", title)
+    return title, author, safe_title
+
+def collect_lines(text, pos, endpos):
+    """text[pos:endpos] 구간의 줄을 양끝 공백을 떼고 빈 줄은 빼서 반환"""
+    return [line for line in map(str.strip, _LINE_RE.findall(text, pos, endpos)) if line]
+
+def detect_chapters(text):
+    """텍스트에서 챕터 자동 감지 (챕터를 찾는 대로 문단 목록과 함께 하나씩 반환)"""
+    current_chapter = "시작"
+    found = False
+    headers = []  # 본문 없이 챕터 제목만 있는 경우를 위한 보관
+    start = 0
+    
+    # 챕터 제목 줄만 전체 텍스트에서 한 번에 찾고, 그 사이 본문은 구간째 줄로 나눔
+    header_matches = _CHAPTER_LINE_RE.finditer(text)
+    first = _CHAPTER_FIRST_LINE_RE.match(text)
+    if first:
+        header_matches = itertools.chain([first], _CHAPTER_LINE_RE.finditer(text, first.end()))
+    
+    for match in header_matches:
+        current_lines = collect_lines(text, start, match.start())
+        chapter_title = match.group().strip()
+        if current_lines:
+            yield current_chapter, current_lines
+            # 다음 구간의 줄을 모으는 동안 이미 넘긴 챕터의 줄을 붙잡고 있지 않음
+            current_lines = None
+            found = True
+        elif not found:
+            headers.append(chapter_title)
+        current_chapter = chapter_title
+        start = match.end()
+    
+    current_lines = collect_lines(text, start, len(text))
+    if current_lines:
+        yield current_chapter, current_lines
+    elif not found:
+        yield "본문", headers
+
+def build_single_epub(file_name, file_content, cover_image=None, use_chapter_split=True, font_assets=None,
+                      encoding=None):
+    """단일 TXT 파일을 EPUB으로 변환
+
+    작업 프로세스에서 실행되므로 Streamlit UI를 직접 호출하지 않고,
+    감지된 인코딩을 함께 반환한다. 오류는 호출한 쪽에서 처리한다.
+    encoding을 주면 감지를 건너뛰고 그 인코딩으로 바로 디코딩한다.
+    """
+    # 결과를 프로세스 간에 넘겨야 하므로 피클 가능한 BytesIO에 씀 (보관은 메인 프로세스에서 임시 파일로)
+    epub_stream = io.BytesIO()
+    book_id = str(uuid.uuid4())
+    
+    # 메타데이터 추출
+    title, author, safe_title = extract_metadata(file_name)
+    
+    # 인코딩 감지 및 UTF-8로 변환 (업로드 때 미리 감지해 둔 인코딩이 있으면 그대로 사용)
+    if encoding:
+        detected_encoding, text = encoding, file_content.decode(encoding, errors='replace')
+    else:
+        detected_encoding, text = detect_encoding(file_content)
+    
+    # 텍스트 정리
+    text = clean_text(text)
+    text = process_paragraphs(text)
+    
+    # 폰트 설정 (여러 파일을 변환할 때는 미리 만든 값이나 작업 프로세스에 보관된 값을 씀)
+    if font_assets is None:
+        font_assets = _worker_font_assets or build_font_assets("리디바탕")
+    
+    # 챕터 분할
+    if use_chapter_split:
+        chapters = detect_chapters(text)
+    else:
+        chapters = [("본문", collect_lines(text, 0, len(text)))]
+    
+    with zipfile.ZipFile(epub_stream, "w", compression=zipfile.ZIP_DEFLATED,
+                         compresslevel=EPUB_COMPRESS_LEVEL) as zf:
+        # mimetype 파일
+        zf.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
+        
+        # container.xml
+        zf.writestr("META-INF/container.xml", CONTAINER_XML_BYTES)
+        
+        # 폰트 추가
+        zf.writestr(font_assets["path"], font_assets["bytes"])
+        
+        # CSS 추가
+        zf.writestr("OEBPS/style.css", font_assets["css"])
+        
+        # 표지 처리
+        cover_manifest = ""
+        cover_meta = ""
+        cover_spine = ""
+        
+        if cover_image:
+            # JPEG/PNG는 이미 압축된 형식이라 다시 압축하지 않음
+            zf.writestr("OEBPS/cover.jpg", cover_image, compress_type=zipfile.ZIP_STORED)
+            
+            zf.writestr("OEBPS/cover.xhtml", COVER_XHTML_BYTES)
+            
+            cover_manifest = COVER_MANIFEST_ITEMS
+            cover_meta = '<meta name="cover" content="cover-img"/>'
+            cover_spine = '<itemref idref="cover-xhtml"/>'
+        
+        # 챕터 처리 (조각을 모아 마지막에 한 번에 합침)
+        manifest_parts = []
+        spine_parts = [cover_spine] if cover_spine else []
+        nav_parts = []
+        
+        # enumerate는 직전에 넘긴 튜플을 다음 챕터를 받을 때까지 붙잡아 두므로 번호를 직접 셈
+        i = 0
+        for ch_title, ch_lines in chapters:
+            fname = f"chapter_{i:04d}.xhtml"
+            
+            header = ""
+            if i == 0:
+                header = f"<h1>{html.escape(title)}</h1>"
+                if author != "미상":
+                    header += f'<p class="author">{html.escape(author)}</p>'
+            
+            escaped_title = html.escape(ch_title)
+            chapter_header = f"<h2>{escaped_title}</h2>"
+            # 챕터 본문 전체를 한 번에 이스케이프한 뒤 줄마다 <p>로 감쌈
+            if ch_lines:
+                chapter_content = "<p>" + html.escape("\n".join(ch_lines)).replace("\n", "</p><p>") + "</p>"
+            else:
+                chapter_content = ""
+            
+            xhtml = CHAPTER_XHTML_TEMPLATE.format(
+                title=escaped_title,
+                header=header,
+                chapter_header=chapter_header,
+                content=chapter_content,
+            )
+            
+            zf.writestr(f"OEBPS/{fname}", xhtml)
+            # 다음 챕터를 만드는 동안 이번 챕터 본문을 붙잡고 있지 않도록 바로 해제
+            del ch_lines, chapter_content, xhtml
+            
+            manifest_parts.append(f'\n        <item id="chap{i}" href="{fname}" media-type="application/xhtml+xml"/>')
+            spine_parts.append(f'\n        <itemref idref="chap{i}"/>')
+            
+            nav_parts.append(NAVPOINT_TEMPLATE.format(index=i, order=i + 1, title=escaped_title, src=fname))
+            i += 1
+        
+        # ncx 파일
+        ncx = NCX_TEMPLATE.format(
+            book_id=book_id,
+            title=html.escape(title),
+            navpoints="".join(nav_parts),
+        )
+        zf.writestr("OEBPS/toc.ncx", ncx)
+        
+        # content.opf
+        opf = OPF_TEMPLATE.format(
+            title=html.escape(title),
+            author=html.escape(author),
+            book_id=book_id,
+            cover_meta=cover_meta,
+            cover_manifest=cover_manifest,
+            manifest_items="".join(manifest_parts),
+            font_item=font_assets["manifest_item"],
+            spine_items="".join(spine_parts),
+        )
+        zf.writestr("OEBPS/content.opf", opf)
+    
+    epub_stream.seek(0)
+    return (safe_title, epub_stream, detected_encoding)
\ No newline at end of file